@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, TypeVar
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 import pyro
+import torch
 
 from chirho.counterfactual.handlers.ambiguity import FactualConditioningMessenger
 from chirho.counterfactual.ops import split
@@ -141,8 +142,17 @@ class MultiWorldCounterfactual(IndexPlatesMessenger, BaseCounterfactualMessenger
 
     fresh_prefix: str = "__fresh_split__"
 
+    # optional reduced-precision dtype for the world-assembly buffer built by
+    # split, e.g. torch.bfloat16 . The assembled value is cast back to the
+    # original dtype, so this is only useful when the loss of precision in
+    # the intermediate buffer is acceptable, e.g. for discrete-valued
+    # treatment assignments. None (the default) disables the cast.
+    scatter_dtype: Optional[torch.dtype] = None
+
     @classmethod
     def _pyro_split(cls, msg: Dict[str, Any]) -> None:
+        if cls.scatter_dtype is not None:
+            msg["kwargs"]["scatter_dtype"] = cls.scatter_dtype
         if msg["name"] is None:
             index_plates = get_index_plates()
             name, fresh_suffix = cls.fresh_prefix, len(index_plates)
@@ -153,6 +163,37 @@ class MultiWorldCounterfactual(IndexPlatesMessenger, BaseCounterfactualMessenger
             name = msg["name"]
         msg["kwargs"]["name"] = msg["name"] = name
 
+    @classmethod
+    def compile(
+        cls, model: Callable[..., T], *, mode: str = "reduce-overhead"
+    ) -> Callable[..., T]:
+        """
+        Wrap a model with :func:`torch.compile` for use under
+        :class:`MultiWorldCounterfactual` .
+
+        Counterfactual models repeat the same constant-shape world assembly
+        on every SVI or MCMC iteration, so compiling the model function with
+        ``mode="reduce-overhead"`` can eliminate much of the per-iteration
+        Python dispatch overhead. Compilation is applied at the model-function
+        boundary; the returned callable should still be run inside a
+        :class:`MultiWorldCounterfactual` context. World assembly via
+        :func:`~chirho.counterfactual.ops.split` always runs eagerly as a
+        graph break, so only the surrounding model computation is compiled.
+
+        .. warning:: Tensor shapes must be static across calls to the
+           compiled model, as compilation is performed with ``dynamic=False``.
+
+        :param model: Python callable containing Pyro primitives.
+        :param mode: A :func:`torch.compile` mode.
+        :return: The compiled model.
+        """
+        if not hasattr(torch, "compile"):
+            raise NotImplementedError(
+                "MultiWorldCounterfactual.compile requires torch >= 2.0, "
+                f"but found {torch.__version__}"
+            )
+        return torch.compile(model, mode=mode, dynamic=False)
+
 
 class TwinWorldCounterfactual(IndexPlatesMessenger, BaseCounterfactualMessenger):
     """
@@ -1,17 +1,40 @@
 from __future__ import annotations
 
 import functools
-from typing import Tuple, TypeVar
+from typing import Callable, Tuple, TypeVar, cast
 
 import pyro
+import torch
 
-from chirho.indexed.ops import IndexSet, gather, scatter_n
+from chirho.indexed.internals import add_indices
+from chirho.indexed.ops import IndexSet, gather, scatter_many, scatter_n, union
 from chirho.interventional.ops import Intervention, intervene
 
 S = TypeVar("S")
 T = TypeVar("T")
 
 
+def _eager_under_compile(fn: Callable[..., T]) -> Callable[..., T]:
+    # world assembly builds dicts keyed by IndexSet, which torch.compile
+    # cannot guard on, so split runs eagerly as a graph break in models
+    # wrapped with MultiWorldCounterfactual.compile; no-op on torch < 2.0
+    return torch.compiler.disable(fn) if hasattr(torch, "compiler") else fn
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_indexsets(name: str, num_acts: int) -> Tuple[IndexSet, ...]:
+    """
+    Return cached :class:`~chirho.indexed.ops.IndexSet` s for the worlds
+    ``{0}, ..., {num_acts}`` of the index variable ``name`` .
+
+    :func:`split` runs once per intervened sample site, so caching avoids
+    re-allocating the same small index sets in this hot path.
+    The returned index sets are shared and must not be mutated.
+    """
+    return tuple(IndexSet(**{name: frozenset({i})}) for i in range(num_acts + 1))
+
+
+@_eager_under_compile
 @pyro.poutine.runtime.effectful(type="split")
 @functools.partial(pyro.poutine.block, hide_types=["intervene"])
 def split(obs: T, acts: Tuple[Intervention[T], ...], **kwargs) -> T:
@@ -35,12 +58,49 @@ def split(obs: T, acts: Tuple[Intervention[T], ...], **kwargs) -> T:
 
     """
     name = kwargs.get("name", None)
-    obs_idx = IndexSet(**{name: {0}})
+    event_dim = kwargs.get("event_dim", 0)
+    obs_idx, *act_idxs = _split_indexsets(name, len(acts))
+
+    # optional reduced-precision world assembly, opted into via
+    # MultiWorldCounterfactual.scatter_dtype ; the result is cast back
+    scatter_dtype = kwargs.pop("scatter_dtype", None)
+    orig_dtype = None
+    if (
+        scatter_dtype is not None
+        and isinstance(obs, torch.Tensor)
+        and obs.is_floating_point()
+        and obs.dtype != scatter_dtype
+    ):
+        orig_dtype = obs.dtype
+        obs = cast(T, obs.to(scatter_dtype))
+
+    if (
+        len(acts) == 1
+        and not event_dim
+        and "name_to_dim" not in kwargs
+        and isinstance(obs, torch.Tensor)
+    ):
+        # fast path for the common case of a single intervention on a
+        # scalar-valued site: allocate the index plate directly and assemble
+        # the result with scatter_many, skipping the generic scatter_n
+        # machinery whose only effect here is the same plate allocation
+        (act_idx,) = act_idxs
+        add_indices(union(obs_idx, act_idx))
+        obs_value = gather(obs, obs_idx, **kwargs)
+        act_value = gather(intervene(obs_value, acts[0], **kwargs), act_idx, **kwargs)
+        if orig_dtype is not None and isinstance(act_value, torch.Tensor):
+            act_value = act_value.to(scatter_dtype)
+        result = scatter_many({obs_idx: obs_value, act_idx: act_value}, event_dim=0)
+        return result.to(orig_dtype) if orig_dtype is not None else result
+
     act_values = {obs_idx: gather(obs, obs_idx, **kwargs)}
-    for i, act in enumerate(acts):
-        act_idx = IndexSet(**{name: {i + 1}})
-        act_values[act_idx] = gather(
+    for act_idx, act in zip(act_idxs, acts):
+        act_value = gather(
             intervene(act_values[obs_idx], act, **kwargs), act_idx, **kwargs
         )
+        if orig_dtype is not None and isinstance(act_value, torch.Tensor):
+            act_value = act_value.to(scatter_dtype)
+        act_values[act_idx] = act_value
 
-    return scatter_n(act_values, event_dim=kwargs.get("event_dim", 0))
+    result = scatter_n(act_values, event_dim=event_dim)
+    return result.to(orig_dtype) if orig_dtype is not None else result
@@ -1,6 +1,6 @@
-import collections
 import functools
-from typing import Any, Callable, Dict, Hashable, List, Optional
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set
 
 import pyro
 import torch
@@ -17,8 +17,9 @@ P = ParamSpec("P")
 
 
 class IndexPlatesMessenger(pyro.poutine.messenger.Messenger):
-    plates: Dict[Hashable, pyro.poutine.indep_messenger.IndepMessenger]
+    plates: Optional[Dict[Hashable, pyro.poutine.indep_messenger.IndepMessenger]]
     first_available_dim: int
+    _stack_idx: int
 
     def __init__(self, first_available_dim: Optional[int] = None):
         if first_available_dim is None:
@@ -26,18 +27,30 @@ class IndexPlatesMessenger(pyro.poutine.messenger.Messenger):
         assert first_available_dim < 0
         self._orig_dim = first_available_dim
         self.first_available_dim = first_available_dim
-        self.plates = collections.OrderedDict()
+        # allocated lazily by _pyro_add_indices, so that entering the handler
+        # around a model with no interventions allocates nothing
+        self.plates = None
+        # cached value returned by _pyro_get_index_plates, invalidated
+        # whenever the set of plates changes
+        self._frames_cache: Optional[
+            Dict[Hashable, pyro.poutine.indep_messenger.CondIndepStackFrame]
+        ] = None
         super().__init__()
 
     def __enter__(self):
         ret = super().__enter__()
-        for name in self.plates.keys():
-            self.plates[name].__enter__()
+        # this instance's position in Pyro's handler stack is fixed until exit,
+        # so compute it once here rather than rescanning in _enter_index_plate
+        self._stack_idx = pyro.poutine.runtime._PYRO_STACK.index(self)
+        if self.plates is not None:
+            for name in self.plates.keys():
+                self.plates[name].__enter__()
         return ret
 
     def __exit__(self, exc_type, exc_value, traceback):
-        for name in reversed(list(self.plates.keys())):
-            self.plates[name].__exit__(exc_type, exc_value, traceback)
+        if self.plates is not None:
+            for name in reversed(list(self.plates.keys())):
+                self.plates[name].__exit__(exc_type, exc_value, traceback)
         return super().__exit__(exc_type, exc_value, traceback)
 
     def __call__(self, fn: Callable) -> Callable:
@@ -53,15 +66,25 @@ class IndexPlatesMessenger(pyro.poutine.messenger.Messenger):
                 return handled_fn(*args, **kwargs)
             finally:
                 if self not in pyro.poutine.runtime._PYRO_STACK:
-                    for p in list(self.plates):
-                        assert p not in pyro.poutine.runtime._PYRO_STACK
-                        del self.plates[p]
+                    if self.plates is not None:
+                        for p in self.plates.values():
+                            assert p not in pyro.poutine.runtime._PYRO_STACK
+                        self.plates = None
+                    self._frames_cache = None
                     self.first_available_dim = self._orig_dim
 
         return wrapped_handled_fn
 
     def _pyro_get_index_plates(self, msg):
-        msg["value"] = {name: plate.frame for name, plate in self.plates.items()}
+        # plates only change via _pyro_add_indices, so the frame dict can be
+        # rebuilt lazily rather than reallocated at every sample site
+        if self._frames_cache is None:
+            self._frames_cache = (
+                {}
+                if self.plates is None
+                else {name: plate.frame for name, plate in self.plates.items()}
+            )
+        msg["value"] = self._frames_cache
         msg["done"], msg["stop"] = True, True
 
     def _enter_index_plate(self, plate: _LazyPlateMessenger) -> _LazyPlateMessenger:
@@ -78,12 +101,16 @@ class IndexPlatesMessenger(pyro.poutine.messenger.Messenger):
             else:
                 raise e
         stack: List[pyro.poutine.messenger.Messenger] = pyro.poutine.runtime._PYRO_STACK
-        stack.pop(stack.index(plate))
-        stack.insert(stack.index(self) + len(self.plates) + 1, plate)
+        assert stack[-1] is plate  # plate.__enter__() just pushed it
+        stack.pop()
+        assert self.plates is not None  # allocated by _pyro_add_indices
+        stack.insert(self._stack_idx + len(self.plates) + 1, plate)
         return plate
 
     def _pyro_add_indices(self, msg):
         (indexset,) = msg["args"]
+        if self.plates is None:
+            self.plates = {}
         for name, indices in indexset.items():
             if name not in self.plates:
                 new_size = max(max(indices) + 1, len(indices))
@@ -99,6 +126,7 @@ class IndexPlatesMessenger(pyro.poutine.messenger.Messenger):
                     )
                 )
                 self.first_available_dim -= 1
+                self._frames_cache = None
             else:
                 assert (
                     0
@@ -113,6 +141,27 @@ class IndexPlatesMessenger(pyro.poutine.messenger.Messenger):
         msg["stop"] = True
 
 
+@torch.jit.script
+def _combine_masks(a: Optional[torch.Tensor], b: torch.Tensor) -> torch.Tensor:
+    # scripted to avoid Python dispatch overhead at every sample site
+    return b if a is None else a & b
+
+
+# ids of mask tensors created by _combine_masks, which are owned by the sample
+# site they were created for and may therefore be updated in place when several
+# DependentMaskMessenger instances are stacked; masks provided by users or
+# other handlers are never in this set and are always combined out of place.
+# Ownership is tracked by id rather than with a weakref.WeakSet because
+# WeakSet membership tests go through Tensor.__eq__, which is elementwise.
+_owned_mask_ids: Set[int] = set()
+
+
+def _own_mask(mask: torch.Tensor) -> torch.Tensor:
+    _owned_mask_ids.add(id(mask))
+    weakref.finalize(mask, _owned_mask_ids.discard, id(mask))
+    return mask
+
+
 class DependentMaskMessenger(pyro.poutine.messenger.Messenger):
     """
     Abstract base class for effect handlers that select a subset of worlds.
@@ -134,7 +183,19 @@ class DependentMaskMessenger(pyro.poutine.messenger.Messenger):
         device = get_sample_msg_device(msg["fn"], msg["value"])
         name = msg["name"] if "name" in msg else None
         mask = self.get_mask(msg["fn"], msg["value"], device=device, name=name)
-        msg["mask"] = mask if msg["mask"] is None else msg["mask"] & mask
+        prev_mask = msg["mask"]
+        if prev_mask is None:
+            msg["mask"] = mask
+        elif (
+            isinstance(prev_mask, torch.Tensor)
+            and id(prev_mask) in _owned_mask_ids
+            and torch.broadcast_shapes(prev_mask.shape, mask.shape) == prev_mask.shape
+        ):
+            msg["mask"] = prev_mask.logical_and_(mask)
+        elif isinstance(prev_mask, torch.Tensor):
+            msg["mask"] = _own_mask(_combine_masks(prev_mask, mask))
+        else:  # e.g. a plain bool mask from pyro.poutine.mask
+            msg["mask"] = prev_mask & mask
 
         # expand distribution to make sure two copies of a variable are sampled
         msg["fn"] = msg["fn"].expand(
@@ -1,5 +1,7 @@
+import functools
 import numbers
-from typing import Dict, Hashable, Optional, TypeVar, Union
+import os
+from typing import Dict, Hashable, Optional, Tuple, TypeVar, Union
 
 import pyro
 import pyro.infer.reparam
@@ -19,6 +21,40 @@ from chirho.indexed.ops import (
 K = TypeVar("K")
 T = TypeVar("T")
 
+# Escape hatch for A/B testing the index_copy_-based fast path in scatter
+# against the legacy advanced-indexing write path.
+_USE_LEGACY_SCATTER: bool = os.environ.get("CHIRHO_USE_SCATTER", "0") == "1"
+
+
+# one-entry cache mapping the frame dict returned by get_index_plates to its
+# derived {name: dim} mapping; the frame dict is identity-stable between plate
+# allocations, so the derived mapping can be computed once per model structure
+# instead of once per sample site
+_NAME_TO_DIM_CACHE: Tuple[
+    Optional[Dict[Hashable, CondIndepStackFrame]],
+    Dict[Hashable, int],
+] = (None, {})
+
+
+def _get_name_to_dim() -> Dict[Hashable, int]:
+    global _NAME_TO_DIM_CACHE
+    frames = get_index_plates()
+    if frames is not _NAME_TO_DIM_CACHE[0]:
+        _NAME_TO_DIM_CACHE = (frames, {name: f.dim for name, f in frames.items()})
+    return _NAME_TO_DIM_CACHE[1]
+
+
+@functools.lru_cache(maxsize=1024)
+def _index_tensor(indices: Tuple[int, ...], device: torch.device) -> torch.Tensor:
+    """
+    Return a cached 1-D long tensor of the given sorted world indices.
+
+    :func:`gather` and :func:`scatter` rebuild the same small index tensors
+    from the same few world index sets at every sample site; the cached
+    tensors are read-only and must not be mutated by callers.
+    """
+    return torch.tensor(indices, device=device, dtype=torch.long)
+
 
 # Note that `gather` is defined using a `@functools.singledispatch` decorator,
 # which in turn defines the `@gather.register` decorator used here
@@ -50,7 +86,7 @@ def _gather_tensor(
         event_dim = 0
 
     if name_to_dim is None:
-        name_to_dim = {name: f.dim for name, f in get_index_plates().items()}
+        name_to_dim = _get_name_to_dim()
 
     result = value
     for name, indices in indexset.items():
@@ -61,7 +97,7 @@ def _gather_tensor(
             continue
         result = result.index_select(
             name_to_dim[name] - event_dim,
-            torch.tensor(list(sorted(indices)), device=value.device, dtype=torch.long),
+            _index_tensor(tuple(sorted(indices)), value.device),
         )
     return result
 
@@ -108,7 +144,7 @@ def _scatter_tensor(
         event_dim = 0
 
     if name_to_dim is None:
-        name_to_dim = {name: f.dim for name, f in get_index_plates().items()}
+        name_to_dim = _get_name_to_dim()
 
     value = gather(value, indexset, event_dim=event_dim, name_to_dim=name_to_dim)
     indexset = union(
@@ -125,7 +161,29 @@ def _scatter_tensor(
         )
         for name, indices in indexset.items():
             result_shape[name_to_dim[name] - event_dim] = index_plates[name].size
-        result = value.new_zeros(result_shape)
+        # when the indexed write below covers every position of the result,
+        # the zero-fill is wasted bandwidth and an uninitialized buffer suffices
+        covers_result = all(
+            len(indices) == result_shape[name_to_dim[name] - event_dim]
+            for name, indices in indexset.items()
+        )
+        result = (
+            value.new_empty(result_shape)
+            if covers_result
+            else value.new_zeros(result_shape)
+        )
+
+    if not _USE_LEGACY_SCATTER and len(indexset) == 1:
+        # single-variable case: a 1-D index and index_copy_ avoid materializing
+        # the full advanced-indexing grid used by the generic path below
+        ((name, indices),) = indexset.items()
+        dim = name_to_dim[name] - event_dim
+        if len(result.shape) >= -dim and result.shape[dim] > 1:
+            src_shape = list(result.shape)
+            src_shape[dim] = len(indices)
+            index_1d = _index_tensor(tuple(sorted(indices)), value.device)
+            result.index_copy_(dim, index_1d, value.expand(src_shape))
+            return result
 
     index = [
         torch.arange(0, result.shape[i], dtype=torch.long).reshape(
@@ -135,8 +193,8 @@ def _scatter_tensor(
     ]
     for name, indices in indexset.items():
         if result.shape[name_to_dim[name] - event_dim] > 1:
-            index[name_to_dim[name] - event_dim] = torch.tensor(
-                list(sorted(indices)), device=value.device, dtype=torch.long
+            index[name_to_dim[name] - event_dim] = _index_tensor(
+                tuple(sorted(indices)), value.device
             ).reshape((-1,) + (1,) * (event_dim - name_to_dim[name] - 1))
 
     result[tuple(index)] = value
@@ -168,9 +226,7 @@ def _indices_of_tuple(value: tuple, **kwargs) -> IndexSet:
 @indices_of.register
 def _indices_of_shape(value: torch.Size, **kwargs) -> IndexSet:
     name_to_dim = (
-        kwargs["name_to_dim"]
-        if "name_to_dim" in kwargs
-        else {name: f.dim for name, f in get_index_plates().items()}
+        kwargs["name_to_dim"] if "name_to_dim" in kwargs else _get_name_to_dim()
     )
     value = value[: len(value) - kwargs.get("event_dim", 0)]
     return IndexSet(
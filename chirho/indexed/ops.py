@@ -5,6 +5,13 @@ from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
 import pyro
 import torch
 
+try:
+    from torch_scatter import segment_coo
+
+    HAS_TORCH_SCATTER = True
+except ImportError:
+    HAS_TORCH_SCATTER = False
+
 T = TypeVar("T")
 
 
@@ -45,19 +52,34 @@ class IndexSet(Dict[str, Set[int]]):
     """
 
     def __init__(self, **mapping: Union[int, Iterable[int]]):
+        # frozensets are kept as-is so that interned index sets can be shared
+        # across calls without copying in hot paths such as split
         super().__init__(
             **{
-                k: {vs} if isinstance(vs, int) else set(vs)
+                k: (
+                    {vs}
+                    if isinstance(vs, int)
+                    else vs if isinstance(vs, frozenset) else set(vs)
+                )
                 for k, vs in mapping.items()
                 if vs
             }
         )
 
+    _hash: int
+
     def __repr__(self):
         return f"{type(self).__name__}({super().__repr__()})"
 
     def __hash__(self):
-        return hash(frozenset((k, frozenset(vs)) for k, vs in self.items()))
+        # hashing recurses into every value set, and the same few IndexSets
+        # are hashed at every sample site, so cache the result on first use;
+        # an IndexSet should not be mutated once it has been used as a key
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset((k, frozenset(vs)) for k, vs in self.items()))
+            return self._hash
 
 
 def union(*indexsets: IndexSet) -> IndexSet:
@@ -86,7 +108,7 @@ def union(*indexsets: IndexSet) -> IndexSet:
     """
     return IndexSet(
         **{
-            k: set.union(*[vs[k] for vs in indexsets if k in vs])
+            k: set().union(*(vs[k] for vs in indexsets if k in vs))
             for k in set.union(*(set(vs) for vs in indexsets))
         }
     )
@@ -259,11 +281,132 @@ def scatter_n(values: Dict[IndexSet, T], *, result: Optional[T] = None, **kwargs
     """
     assert len(values) > 0
     assert all(isinstance(k, IndexSet) for k in values)
+    return scatter_many(values, result=result, **kwargs)
+
+
+def scatter_many(values: Dict[IndexSet, T], *, result: Optional[T] = None, **kwargs):
+    """
+    Scatters a dictionary of disjoint masked values into a single value.
+
+    Unlike :func:`scatter_n` , :func:`scatter_many` is not an effectful operation
+    and does not allocate new index plates for the variables in its input.
+
+    When the entries are tensors indexed by a single shared variable whose
+    index sets partition the variable's entire index range in ascending order
+    (as produced by :func:`~chirho.counterfactual.ops.split` ),
+    the result is assembled with a single allocation and a single fused
+    :func:`torch.cat` along the index dimension, rather than one zero-fill
+    and one broadcasted indexed write per entry.
+
+    :param values: A dictionary mapping index sets to values.
+    :param Optional[T] result: The result to store the scattered values in.
+    :return: A single value.
+    """
+    if result is None:
+        fused = _scatter_fused_tensor(values, **kwargs)
+        if fused is not None:
+            return fused
     for indices, value in values.items():
         result = scatter(value, indices, result=result, **kwargs)
     return result
 
 
+def _scatter_fused_tensor(
+    values: Dict[IndexSet, T],
+    *,
+    event_dim: int = 0,
+    name_to_dim: Optional[Dict[Hashable, int]] = None,
+    **kwargs,
+) -> Optional[torch.Tensor]:
+    """
+    Fast path for :func:`scatter_many` in the common case of tensor values
+    indexed by consecutive ascending worlds of a single index variable,
+    e.g. worlds ``{0}`` and ``{1}`` as produced by
+    :func:`~chirho.counterfactual.ops.split` with one intervention.
+
+    The entries jointly cover the index dimension, so instead of allocating
+    a zero-filled result and performing one indexed write per world,
+    the result can be assembled with a single :func:`torch.cat` along the
+    index dimension. Returns ``None`` when the fast path does not apply.
+    """
+    if kwargs or len(values) < 2:
+        return None
+
+    tensors = [v for v in values.values() if isinstance(v, torch.Tensor)]
+    if len(tensors) != len(values):
+        return None
+    if len({(v.dtype, v.device) for v in tensors}) != 1:
+        return None
+
+    indexsets = list(values.keys())
+    if any(len(ind) != 1 for ind in indexsets):
+        return None
+
+    name = next(iter(indexsets[0]))
+    if any(next(iter(ind)) != name for ind in indexsets[1:]):
+        return None
+
+    # the index sets must cover distinct ascending worlds: a full partition
+    # can be assembled by concatenation, and a partial cover can be assembled
+    # by torch_scatter.segment_coo when that optional dependency is available
+    blocks = [sorted(ind[name]) for ind in indexsets]
+    worlds = [w for block in blocks for w in block]
+    index_plates = get_index_plates()
+    if name not in index_plates:
+        return None
+    full_cover = worlds == list(range(index_plates[name].size))
+    if not full_cover and not (HAS_TORCH_SCATTER and worlds == sorted(set(worlds))):
+        return None
+
+    if name_to_dim is None:
+        name_to_dim = {name: f.dim for name, f in index_plates.items()}
+    if name not in name_to_dim:
+        return None
+
+    dim = name_to_dim[name] - event_dim
+    pad = max([event_dim - f.dim for f in index_plates.values()] + [-dim, 0])
+
+    pieces, piece_shapes = [], []
+    for ind, value in values.items():
+        piece = gather(value, ind, event_dim=event_dim, name_to_dim=name_to_dim)
+        shape = list(torch.broadcast_shapes(piece.shape, (1,) * pad))
+        if shape[dim] not in (1, len(ind[name])):
+            return None
+        shape[dim] = 1
+        pieces.append(piece)
+        piece_shapes.append(torch.Size(shape))
+
+    base_shape = list(torch.broadcast_shapes(*piece_shapes))
+
+    # bail out if a value is only partially indexed by some other variable,
+    # in which case the result must be padded with zeros by the generic path
+    for other, other_dim in name_to_dim.items():
+        if other == name:
+            continue
+        other_dim = other_dim - event_dim
+        other_size = base_shape[other_dim] if -other_dim <= len(base_shape) else 1
+        if other_size == 1:
+            continue
+        if other not in index_plates or other_size != index_plates[other].size:
+            return None
+
+    expanded = []
+    for ind, piece in zip(indexsets, pieces):
+        base_shape[dim] = len(ind[name])
+        expanded.append(piece.expand(base_shape))
+    src = torch.cat(expanded, dim=dim)
+    if full_cover:
+        return src
+
+    # sorted partial cover: one segment_coo call fills the remaining
+    # worlds with zeros, exploiting the sorted index as in segment_coo's
+    # contract instead of one indexed write per entry
+    index = torch.tensor(worlds, device=src.device, dtype=torch.long)
+    return segment_coo(
+        src.movedim(dim, 0).contiguous(), index, dim_size=index_plates[name].size
+    ).movedim(0, dim)
+
+
 @functools.singledispatch
 def cond(fst, snd, case: Optional[T] = None, **kwargs):
     """
@@ -121,6 +121,50 @@ def test_intervene_distribution_same():
     assert intervene(dist.Normal(1, 1), d) is d
 
 
+@pytest.mark.parametrize("x_cf_value", x_cf_values)
+def test_scatter_dtype_roundtrip(x_cf_value):
+    class ReducedPrecisionCounterfactual(MultiWorldCounterfactual):
+        scatter_dtype = torch.float64
+
+    with ReducedPrecisionCounterfactual():
+        x = intervene(torch.tensor(1.0), torch.tensor(x_cf_value), name="x_ax")
+        x_factual = gather(x, IndexSet(x_ax={0}))
+        x_counterfactual = gather(x, IndexSet(x_ax={1}))
+
+    assert x.dtype == torch.float32
+    assert x_factual.squeeze() == torch.tensor(1.0)
+    assert x_counterfactual.squeeze() == torch.tensor(x_cf_value)
+
+
+@pytest.mark.skipif(
+    not hasattr(torch, "compile"), reason="torch.compile requires torch >= 2.0"
+)
+def test_compile_matches_eager():
+    def model():
+        x = pyro.sample("x", dist.Normal(0.0, 1.0))
+        x = intervene(x, torch.tensor(2.0), name="x_ax")
+        return pyro.sample("y", dist.Normal(x, 1.0))
+
+    compiled_model = MultiWorldCounterfactual.compile(model)
+
+    with MultiWorldCounterfactual():
+        pyro.set_rng_seed(101)
+        expected = model()
+
+    with MultiWorldCounterfactual():
+        pyro.set_rng_seed(101)
+        actual = compiled_model()
+
+    assert actual.shape == expected.shape
+    assert torch.allclose(actual, expected)
+
+
+def test_compile_requires_torch_2(monkeypatch):
+    monkeypatch.delattr(torch, "compile", raising=False)
+    with pytest.raises(NotImplementedError):
+        MultiWorldCounterfactual.compile(lambda: None)
+
+
 @pytest.mark.parametrize("x_cf_value", x_cf_values)
 @pytest.mark.parametrize("event_shape", [(), (4,), (4, 3)])
 @pytest.mark.parametrize("cf_dim", [-1, -2, -3, None])
@@ -2,11 +2,12 @@ import contextlib
 import itertools
 import logging
 
+import pyro
 import pyro.distributions as dist
 import pytest
 import torch
 
-from chirho.indexed.handlers import IndexPlatesMessenger
+from chirho.indexed.handlers import DependentMaskMessenger, IndexPlatesMessenger
 from chirho.indexed.internals import add_indices
 from chirho.indexed.ops import (
     IndexSet,
@@ -17,6 +18,7 @@ from chirho.indexed.ops import (
     indexset_as_mask,
     indices_of,
     scatter,
+    scatter_many,
     scatter_n,
     union,
 )
@@ -367,6 +369,32 @@ def test_scatter_broadcast_new(enum_shape, plate_shape, batch_shape, event_shape
     assert (actual2 == value2).all()
 
 
+@pytest.mark.parametrize(
+    "enum_shape,plate_shape,batch_shape,event_shape", SHAPE_CASES, ids=str
+)
+def test_scatter_many(enum_shape, plate_shape, batch_shape, event_shape):
+    new_dim = -len(batch_shape) - len(plate_shape) - 1
+    event_dim = len(event_shape)
+
+    value1 = torch.randn(enum_shape + (1,) + batch_shape + plate_shape + event_shape)
+    value2 = torch.randn(enum_shape + (1,) + batch_shape + plate_shape + event_shape)
+    ind1, ind2 = IndexSet(new_dim={0}), IndexSet(new_dim={1, 2})
+
+    with IndexPlatesMessenger(new_dim):
+        add_indices(IndexSet(new_dim={0, 1, 2}))
+
+        actual = scatter_many({ind1: value1, ind2: value2}, event_dim=event_dim)
+
+        expected = torch.zeros(
+            enum_shape + (3,) + batch_shape + plate_shape + event_shape
+        )
+        for ind, value in {ind1: value1, ind2: value2}.items():
+            expected = scatter(value, ind, result=expected, event_dim=event_dim)
+
+    assert actual.shape == expected.shape
+    assert (actual == expected).all()
+
+
 @pytest.mark.parametrize(
     "enum_shape,plate_shape,batch_shape,event_shape", SHAPE_CASES, ids=str
 )
@@ -480,3 +508,33 @@ def test_cond_tensor_associate(enum_shape, batch_shape, plate_shape, event_shape
     assert actual_full.shape == actual_left.shape == actual_right.shape
     assert (actual_full == actual_left).all()
     assert (actual_left == actual_right).all()
+
+
+def test_stacked_dependent_mask_handlers():
+    class MaskedSites(DependentMaskMessenger):
+        def __init__(self, mask):
+            self.mask = mask
+            super().__init__()
+
+        def get_mask(self, dist, value, device=torch.device("cpu"), name=None):
+            return self.mask
+
+    masks = [
+        torch.tensor([True, True, False]),
+        torch.tensor([True, False, True]),
+        torch.tensor([False, True, True]),
+    ]
+
+    def model():
+        return pyro.sample("x", dist.Normal(torch.zeros(3), 1.0))
+
+    with contextlib.ExitStack() as stack:
+        for mask in masks:
+            stack.enter_context(MaskedSites(mask))
+        tr = pyro.poutine.trace(model).get_trace()
+
+    expected = masks[0] & masks[1] & masks[2]
+    assert (tr.nodes["x"]["mask"] == expected).all()
+    # masks provided by handlers are combined out of place, not mutated
+    for mask in masks:
+        assert mask.sum() == 2